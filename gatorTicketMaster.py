@@ -4,7 +4,8 @@ GatorTicketMaster - A Seat Reservation System
 This program implements a ticket booking system using the following data structures:
 1. Red-Black Tree: For managing seat reservations with O(log n) operations
 2. Binary Min-Heap: For managing the waitlist with priority-based ordering
-3. Binary Min-Heap: For managing available seats with lowest-number-first allocation
+3. Binary Min-Heap: For managing released seats with lowest-number-first allocation,
+   alongside a counter for the range of seats that were never reserved
 
 Key Features:
 - Priority-based seat allocation for waitlisted users
@@ -13,8 +14,59 @@ Key Features:
 - Range-based seat release operations
 """
 
-import sys
-import re
+import argparse
+import heapq
+import struct
+from typing import IO, Any, Final, Iterator, Optional
+
+# Buffered output is written to the file once it reaches this many characters
+# (or bytes, for binary logs)
+_OUTPUT_FLUSH_SIZE = 1 << 16
+
+
+class Event:
+    """
+    Codes for each kind of output line.
+    Text output fills EVENT_FORMATS[code] with the event's arguments; binary
+    logs store the code and its integer arguments as one fixed-size record.
+    """
+
+    INITIALIZED: Final = 0
+    AVAILABLE: Final = 1
+    RESERVED: Final = 2
+    WAITLISTED: Final = 3
+    CANCELED: Final = 4
+    NOT_CANCELED: Final = 5
+    PRIORITY_UPDATED: Final = 6
+    PRIORITY_NOT_UPDATED: Final = 7
+    SEATS_ADDED: Final = 8
+    LEFT_WAITLIST: Final = 9
+    NOT_IN_WAITLIST: Final = 10
+    RESERVATION: Final = 11
+    RELEASED: Final = 12
+    TERMINATED: Final = 13
+
+
+EVENT_FORMATS = {
+    Event.INITIALIZED: "%d Seats are made available for reservation",
+    Event.AVAILABLE: "Total Seats Available : %d, Waitlist : %d",
+    Event.RESERVED: "User %d reserved seat %d",
+    Event.WAITLISTED: "User %d is added to the waiting list",
+    Event.CANCELED: "User %d canceled their reservation",
+    Event.NOT_CANCELED: "User %d has no reservation for seat %d to cancel",
+    Event.PRIORITY_UPDATED: "User %d priority has been updated to %d",
+    Event.PRIORITY_NOT_UPDATED: "User %d priority is not updated",
+    Event.SEATS_ADDED: "Additional %d Seats are made available for reservation",
+    Event.LEFT_WAITLIST: "User %d is removed from the waiting list",
+    Event.NOT_IN_WAITLIST: "User %d is not in waitlist",
+    Event.RESERVATION: "Seat %d, User %d",
+    Event.RELEASED: "Reservations of the Users in the range [%d, %d] are released",
+    Event.TERMINATED: "Program Terminated!!",
+}
+
+# Binary log record: event code followed by two signed 64-bit arguments,
+# unused arguments are written as 0
+_RECORD = struct.Struct("<Bqq")
 
 
 class Color:
@@ -23,8 +75,8 @@ class Color:
     Used to maintain Red-Black Tree properties for balanced operations.
     """
 
-    RED = 1
-    BLACK = 2
+    RED: Final = 1
+    BLACK: Final = 2
 
 
 class RBNode:
@@ -40,12 +92,16 @@ class RBNode:
         color: Color of the node (RED or BLACK)
     """
 
-    def __init__(self, user_id, seat_id):
+    # Fixed slots keep nodes small and make field access a descriptor
+    # lookup instead of a per-instance __dict__ lookup
+    __slots__ = ("user_id", "seat_id", "parent", "left", "right", "color")
+
+    def __init__(self, user_id: int, seat_id: int) -> None:
         self.user_id = user_id  # Key
         self.seat_id = seat_id  # Value
-        self.parent = None
-        self.left = None
-        self.right = None
+        self.parent: Optional[RBNode] = None
+        self.left: Optional[RBNode] = None
+        self.right: Optional[RBNode] = None
         self.color = Color.RED
 
 
@@ -59,119 +115,147 @@ class RedBlackTree:
     2. No red node has a red child
     3. Every path from root to leaf has same number of black nodes
     4. New insertions are always red
+
+    Nodes are keyed by user_id; a seat_id -> node index alongside the tree
+    gives O(1) lookups by seat.
     """
 
-    def __init__(self):
-        self.NIL = RBNode(None, None)
-        self.NIL.color = Color.BLACK
-        self.root = self.NIL
+    def __init__(self) -> None:
+        # Missing children and the root's parent are None, which counts as black
+        self.root: Optional[RBNode] = None
+        self.seat_index: dict[int, RBNode] = {}
 
-    def left_rotate(self, x):
+    def left_rotate(self, x: RBNode) -> None:
         y = x.right
+        assert y is not None
         x.right = y.left
-        if y.left != self.NIL:
+        if y.left is not None:
             y.left.parent = x
         y.parent = x.parent
-        if x.parent == self.NIL:
+        if x.parent is None:
             self.root = y
-        elif x == x.parent.left:
+        elif x is x.parent.left:
             x.parent.left = y
         else:
             x.parent.right = y
         y.left = x
         x.parent = y
 
-    def right_rotate(self, x):
+    def right_rotate(self, x: RBNode) -> None:
         y = x.left
+        assert y is not None
         x.left = y.right
-        if y.right != self.NIL:
+        if y.right is not None:
             y.right.parent = x
         y.parent = x.parent
-        if x.parent == self.NIL:
+        if x.parent is None:
             self.root = y
-        elif x == x.parent.right:
+        elif x is x.parent.right:
             x.parent.right = y
         else:
             x.parent.left = y
         y.right = x
         x.parent = y
 
-    def insert_fixup(self, z):
-        while z.parent.color == Color.RED:
-            if z.parent == z.parent.parent.left:
-                y = z.parent.parent.right
-                if y.color == Color.RED:
-                    z.parent.color = Color.BLACK
-                    y.color = Color.BLACK
-                    z.parent.parent.color = Color.RED
-                    z = z.parent.parent
+    def insert_fixup(self, z: RBNode) -> None:
+        RED = Color.RED
+        BLACK = Color.BLACK
+        left_rotate = self.left_rotate
+        right_rotate = self.right_rotate
+
+        parent = z.parent
+        while parent is not None and parent.color == RED:
+            # A red node is never the root, so the grandparent exists
+            grandparent = parent.parent
+            assert grandparent is not None
+            if parent is grandparent.left:
+                y = grandparent.right
+                if y is not None and y.color == RED:
+                    parent.color = BLACK
+                    y.color = BLACK
+                    grandparent.color = RED
+                    z = grandparent
                 else:
-                    if z == z.parent.right:
-                        z = z.parent
-                        self.left_rotate(z)
-                    z.parent.color = Color.BLACK
-                    z.parent.parent.color = Color.RED
-                    self.right_rotate(z.parent.parent)
+                    if z is parent.right:
+                        # After the rotation z and its parent trade places
+                        z, parent = parent, z
+                        left_rotate(z)
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    right_rotate(grandparent)
             else:
-                y = z.parent.parent.left
-                if y.color == Color.RED:
-                    z.parent.color = Color.BLACK
-                    y.color = Color.BLACK
-                    z.parent.parent.color = Color.RED
-                    z = z.parent.parent
+                y = grandparent.left
+                if y is not None and y.color == RED:
+                    parent.color = BLACK
+                    y.color = BLACK
+                    grandparent.color = RED
+                    z = grandparent
                 else:
-                    if z == z.parent.left:
-                        z = z.parent
-                        self.right_rotate(z)
-                    z.parent.color = Color.BLACK
-                    z.parent.parent.color = Color.RED
-                    self.left_rotate(z.parent.parent)
-            if z == self.root:
-                break
-        self.root.color = Color.BLACK
-
-    def insert(self, user_id, seat_id):
+                    if z is parent.left:
+                        z, parent = parent, z
+                        right_rotate(z)
+                    parent.color = BLACK
+                    grandparent.color = RED
+                    left_rotate(grandparent)
+            parent = z.parent
+        root = self.root
+        assert root is not None
+        root.color = BLACK
+
+    def insert(self, user_id: int, seat_id: int) -> None:
         z = RBNode(user_id, seat_id)
-        y = self.NIL
+        y = None
         x = self.root
 
-        while x != self.NIL:
+        while x is not None:
             y = x
-            if z.user_id < x.user_id:
+            if user_id < x.user_id:
                 x = x.left
             else:
                 x = x.right
 
         z.parent = y
-        if y == self.NIL:
+        if y is None:
             self.root = z
-        elif z.user_id < y.user_id:
+        elif user_id < y.user_id:
             y.left = z
         else:
             y.right = z
 
-        z.left = self.NIL
-        z.right = self.NIL
-        z.color = Color.RED
+        self.seat_index[seat_id] = z
         self.insert_fixup(z)
 
-    def inorder_traversal(self, node, result):
-        """Helper method for sorted traversal"""
-        if node != self.NIL:
-            self.inorder_traversal(node.left, result)
-            result.append((node.seat_id, node.user_id))
-            self.inorder_traversal(node.right, result)
+    def get_sorted_reservations(self) -> list[tuple[int, int]]:
+        """Get (seat_id, user_id) reservations sorted by seat_id"""
+        seat_index = self.seat_index
+        return [(seat_id, seat_index[seat_id].user_id) for seat_id in sorted(seat_index)]
 
-    def get_sorted_reservations(self):
-        """Get reservations sorted by seat_id"""
+    def range_query(self, low: int, high: int) -> list[RBNode]:
+        """Get nodes with low <= user_id <= high, in user_id order"""
         result = []
-        self.inorder_traversal(self.root, result)
-        return sorted(result, key=lambda x: x[0])
+        stack = []
+        node = self.root
+        while True:
+            while node is not None:
+                if node.user_id < low:
+                    # The whole left subtree is below the range
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            if node.user_id > high:
+                break
+            result.append(node)
+            node = node.right
+        return result
 
-    def find_by_user_id(self, user_id):
+    def find_by_user_id(self, user_id: int) -> Optional[RBNode]:
         """Find a node by user_id"""
         current = self.root
-        while current != self.NIL:
+        while current is not None:
             if user_id == current.user_id:
                 return current
             elif user_id < current.user_id:
@@ -180,43 +264,38 @@ class RedBlackTree:
                 current = current.right
         return None
 
-    def find_by_seat_id(self, seat_id):
-        """Find a node by seat_id using inorder traversal"""
-
-        def search_seat(node):
-            if node == self.NIL:
-                return None
-            left_result = search_seat(node.left)
-            if left_result:
-                return left_result
-            if node.seat_id == seat_id:
-                return node
-            return search_seat(node.right)
-
-        return search_seat(self.root)
+    def find_by_seat_id(self, seat_id: int) -> Optional[RBNode]:
+        """Find a node by seat_id using the seat index"""
+        return self.seat_index.get(seat_id)
 
-    def delete_node(self, z):
+    def delete_node(self, z: Optional[RBNode]) -> None:
         """Delete a node from the tree"""
-        if not z:
+        if z is None:
             return
 
+        del self.seat_index[z.seat_id]
+
         y = z
         y_original_color = y.color
 
-        if z.left == self.NIL:
+        # x moves into y's old position; x may be None, so track its parent
+        if z.left is None:
             x = z.right
+            x_parent = z.parent
             self._transplant(z, z.right)
-        elif z.right == self.NIL:
+        elif z.right is None:
             x = z.left
+            x_parent = z.parent
             self._transplant(z, z.left)
         else:
             y = self._minimum(z.right)
             y_original_color = y.color
             x = y.right
 
-            if y.parent == z:
-                x.parent = y
+            if y.parent is z:
+                x_parent = y
             else:
+                x_parent = y.parent
                 self._transplant(y, y.right)
                 y.right = z.right
                 y.right.parent = y
@@ -227,84 +306,94 @@ class RedBlackTree:
             y.color = z.color
 
         if y_original_color == Color.BLACK:
-            self._delete_fixup(x)
+            self._delete_fixup(x, x_parent)
 
-    def _transplant(self, u, v):
-        if u.parent == self.NIL:
+    def _transplant(self, u: RBNode, v: Optional[RBNode]) -> None:
+        if u.parent is None:
             self.root = v
-        elif u == u.parent.left:
+        elif u is u.parent.left:
             u.parent.left = v
         else:
             u.parent.right = v
-        v.parent = u.parent
+        if v is not None:
+            v.parent = u.parent
 
-    def _minimum(self, node):
-        while node.left != self.NIL:
+    def _minimum(self, node: RBNode) -> RBNode:
+        while node.left is not None:
             node = node.left
         return node
 
-    def _delete_fixup(self, x):
-        while x != self.root and x.color == Color.BLACK:
-            if x == x.parent.left:
-                w = x.parent.right
-                if w.color == Color.RED:
-                    w.color = Color.BLACK
-                    x.parent.color = Color.RED
-                    self.left_rotate(x.parent)
-                    w = x.parent.right
-                if w.left.color == Color.BLACK and w.right.color == Color.BLACK:
-                    w.color = Color.RED
-                    x = x.parent
+    def _delete_fixup(self, x: Optional[RBNode], parent: Optional[RBNode]) -> None:
+        RED = Color.RED
+        BLACK = Color.BLACK
+        left_rotate = self.left_rotate
+        right_rotate = self.right_rotate
+
+        while x is not self.root and (x is None or x.color == BLACK):
+            # x is not the root, so it has a parent, and x's side is one black
+            # node short, so its sibling w exists
+            assert parent is not None
+            if x is parent.left:
+                w = parent.right
+                assert w is not None
+                if w.color == RED:
+                    w.color = BLACK
+                    parent.color = RED
+                    left_rotate(parent)
+                    w = parent.right
+                    assert w is not None
+                w_left = w.left
+                w_right = w.right
+                if (w_left is None or w_left.color == BLACK) and (
+                    w_right is None or w_right.color == BLACK
+                ):
+                    w.color = RED
+                    x = parent
+                    parent = x.parent
                 else:
-                    if w.right.color == Color.BLACK:
-                        w.left.color = Color.BLACK
-                        w.color = Color.RED
-                        self.right_rotate(w)
-                        w = x.parent.right
-                    w.color = x.parent.color
-                    x.parent.color = Color.BLACK
-                    w.right.color = Color.BLACK
-                    self.left_rotate(x.parent)
+                    if w_right is None or w_right.color == BLACK:
+                        # w_left is red; rotating makes it the new sibling
+                        assert w_left is not None
+                        w_left.color = BLACK
+                        w.color = RED
+                        right_rotate(w)
+                        w, w_right = w_left, w
+                    w.color = parent.color
+                    parent.color = BLACK
+                    w_right.color = BLACK
+                    left_rotate(parent)
                     x = self.root
             else:
-                w = x.parent.left
-                if w.color == Color.RED:
-                    w.color = Color.BLACK
-                    x.parent.color = Color.RED
-                    self.right_rotate(x.parent)
-                    w = x.parent.left
-                if w.right.color == Color.BLACK and w.left.color == Color.BLACK:
-                    w.color = Color.RED
-                    x = x.parent
+                w = parent.left
+                assert w is not None
+                if w.color == RED:
+                    w.color = BLACK
+                    parent.color = RED
+                    right_rotate(parent)
+                    w = parent.left
+                    assert w is not None
+                w_left = w.left
+                w_right = w.right
+                if (w_right is None or w_right.color == BLACK) and (
+                    w_left is None or w_left.color == BLACK
+                ):
+                    w.color = RED
+                    x = parent
+                    parent = x.parent
                 else:
-                    if w.left.color == Color.BLACK:
-                        w.right.color = Color.BLACK
-                        w.color = Color.RED
-                        self.left_rotate(w)
-                        w = x.parent.left
-                    w.color = x.parent.color
-                    x.parent.color = Color.BLACK
-                    w.left.color = Color.BLACK
-                    self.right_rotate(x.parent)
+                    if w_left is None or w_left.color == BLACK:
+                        assert w_right is not None
+                        w_right.color = BLACK
+                        w.color = RED
+                        left_rotate(w)
+                        w, w_left = w_right, w
+                    w.color = parent.color
+                    parent.color = BLACK
+                    w_left.color = BLACK
+                    right_rotate(parent)
                     x = self.root
-        x.color = Color.BLACK
-
-
-class MinHeapNode:
-    """
-    Node class for Binary Min-Heap implementation.
-    Used in both waitlist and available seats management.
-
-    Attributes:
-        priority: User's priority level (negative for max-heap behavior)
-        timestamp: Order of arrival for tie-breaking
-        user_id: Unique identifier for the user
-    """
-
-    def __init__(self, priority, timestamp, user_id):
-        self.priority = priority
-        self.timestamp = timestamp
-        self.user_id = user_id
+        if x is not None:
+            x.color = BLACK
 
 
 class MinHeap:
@@ -312,160 +401,91 @@ class MinHeap:
     Binary Min-Heap implementation for waitlist management.
     Provides O(log n) insert and extract-min operations.
 
+    Entries are (priority, timestamp, user_id) tuples ordered by heapq, so
+    ties on priority fall back to the arrival timestamp. A user who joins
+    the waitlist again while already waiting keeps one entry per request,
+    newest last; removals and priority updates apply to the newest one.
+
     Features:
     - Priority-based ordering (higher priority numbers get preference)
     - FIFO ordering within same priority level using timestamps
-    - Direct access to user positions for updates
+    - Lazy removal: removed or re-prioritized entries stay in the heap
+      and are skipped when they reach the top; the heap is rebuilt once
+      stale entries outnumber live ones
     """
 
-    def __init__(self):
-        self.heap = []
-        self.position = {}
-
-    def parent(self, i):
-        return (i - 1) // 2
-
-    def left_child(self, i):
-        return 2 * i + 1
-
-    def right_child(self, i):
-        return 2 * i + 2
-
-    def swap(self, i, j):
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
-        self.position[self.heap[i].user_id] = i
-        self.position[self.heap[j].user_id] = j
-
-    def compare(self, i, j):
-        """Compare nodes based on priority first, then timestamp
-        Returns True if node i should be above node j in the heap"""
-        if self.heap[i].priority == self.heap[j].priority:
-            return self.heap[i].timestamp < self.heap[j].timestamp
-        return self.heap[i].priority < self.heap[j].priority
-
-    def heapify_up(self, i):
-        while i > 0:
-            parent = self.parent(i)
-            if self.compare(i, parent):
-                self.swap(i, parent)
-                i = parent
-            else:
-                break
-
-    def heapify_down(self, i):
-        min_idx = i
-        n = len(self.heap)
-
-        left = self.left_child(i)
-        right = self.right_child(i)
-
-        if left < n and self.compare(left, min_idx):
-            min_idx = left
-
-        if right < n and self.compare(right, min_idx):
-            min_idx = right
-
-        if min_idx != i:
-            self.swap(i, min_idx)
-            self.heapify_down(min_idx)
-
-    def insert(self, priority, timestamp, user_id):
-        node = MinHeapNode(priority, timestamp, user_id)
-        self.heap.append(node)
-        self.position[user_id] = len(self.heap) - 1
-        self.heapify_up(len(self.heap) - 1)
-
-    def extract_min(self):
-        if not self.heap:
-            return None
-
-        min_node = self.heap[0]
-        last_node = self.heap.pop()
-
-        if self.heap:
-            self.heap[0] = last_node
-            self.position[last_node.user_id] = 0
-            self.heapify_down(0)
-
-        del self.position[min_node.user_id]
-        return min_node
+    def __init__(self) -> None:
+        self.heap: list[tuple[int, int, int]] = []
+        # user_id -> live entries, oldest first
+        self.entries: dict[int, list[tuple[int, int, int]]] = {}
+        self.size = 0  # Number of live entries
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.entries
+
+    def insert(self, priority: int, timestamp: int, user_id: int) -> None:
+        entry = (priority, timestamp, user_id)
+        self.entries.setdefault(user_id, []).append(entry)
+        self.size += 1
+        heapq.heappush(self.heap, entry)
+
+    def extract_min(self) -> Optional[int]:
+        """Pop the highest priority waiting user and return their user_id"""
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            user_id = entry[2]
+            # Skip entries that were removed or superseded by a priority update.
+            # Compare by value: tuples are not guaranteed to keep their identity
+            # (mypyc unboxes them), and an equal tuple is an equivalent entry.
+            live = self.entries.get(user_id)
+            if live is not None and entry in live:
+                live.remove(entry)
+                if not live:
+                    del self.entries[user_id]
+                self.size -= 1
+                return user_id
+        return None
 
-    def remove_user(self, user_id):
-        """Remove a user from the heap by their user_id"""
-        if user_id not in self.position:
+    def remove_user(self, user_id: int) -> bool:
+        """Remove a user's newest waitlist entry by their user_id"""
+        live = self.entries.get(user_id)
+        if live is None:
             return False
-
-        # Get the index of the user to remove
-        idx = self.position[user_id]
-
-        # Replace with the last element
-        last_node = self.heap.pop()
-        if self.heap and idx < len(self.heap):
-            self.heap[idx] = last_node
-            self.position[last_node.user_id] = idx
-
-            # Fix heap property
-            parent = self.parent(idx)
-            if parent >= 0 and self.compare(idx, parent):
-                self.heapify_up(idx)
-            else:
-                self.heapify_down(idx)
-
-        del self.position[user_id]
+        live.pop()
+        if not live:
+            del self.entries[user_id]
+        self.size -= 1
+        self._compact()
         return True
 
+    def remove_range(self, low: int, high: int) -> None:
+        """Remove every user with low <= user_id <= high from the heap"""
+        entries = self.entries
+        removed = [user_id for user_id in entries if low <= user_id <= high]
+        for user_id in removed:
+            self.size -= len(entries.pop(user_id))
+        if removed:
+            self._compact()
+
+    def update_priority(self, user_id: int, priority: int) -> bool:
+        """Re-queue a user's newest entry with a new priority, keeping its timestamp"""
+        live = self.entries.get(user_id)
+        if live is None:
+            return False
+        entry = (priority, live[-1][1], user_id)
+        live[-1] = entry
+        heapq.heappush(self.heap, entry)
+        self._compact()
+        return True
 
-class AvailableSeatsHeap:
-    """
-    Special Min-Heap implementation for managing available seats.
-    Ensures lowest-numbered seats are assigned first.
-
-    Operations:
-    - insert: Add newly available seat
-    - extract_min: Get lowest numbered available seat
-    - All operations maintain O(log n) complexity
-    """
-
-    def __init__(self):
-        self.heap = []
-
-    def insert(self, seat_id):
-        self.heap.append(seat_id)
-        self._heapify_up(len(self.heap) - 1)
-
-    def extract_min(self):
-        if not self.heap:
-            return None
-
-        min_val = self.heap[0]
-        self.heap[0] = self.heap[-1]
-        self.heap.pop()
-
-        if self.heap:
-            self._heapify_down(0)
-
-        return min_val
-
-    def _heapify_up(self, i):
-        parent = (i - 1) // 2
-        if i > 0 and self.heap[i] < self.heap[parent]:
-            self.heap[i], self.heap[parent] = self.heap[parent], self.heap[i]
-            self._heapify_up(parent)
-
-    def _heapify_down(self, i):
-        smallest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
-
-        if left < len(self.heap) and self.heap[left] < self.heap[smallest]:
-            smallest = left
-
-        if right < len(self.heap) and self.heap[right] < self.heap[smallest]:
-            smallest = right
-
-        if smallest != i:
-            self.heap[i], self.heap[smallest] = self.heap[smallest], self.heap[i]
-            self._heapify_down(smallest)
+    def _compact(self) -> None:
+        """Drop stale entries once they make up more than half of the heap"""
+        if len(self.heap) > 2 * self.size:
+            self.heap = [entry for live in self.entries.values() for entry in live]
+            heapq.heapify(self.heap)
 
 
 class SeatReservationSystem:
@@ -475,7 +495,7 @@ class SeatReservationSystem:
     Components:
     - Red-Black Tree for reserved seats
     - Min-Heap for waitlist
-    - Min-Heap for available seats
+    - Min-Heap for released seats, plus the never-reserved seat range
 
     Key operations:
     1. Seat Reservation
@@ -485,35 +505,128 @@ class SeatReservationSystem:
     5. Bulk Seat Release
     """
 
-    def __init__(self, output_file):
+    def __init__(
+        self, output_file: str, verbose: bool = False, binary_log: bool = False
+    ) -> None:
         self.reserved_seats = RedBlackTree()  # Red-Black Tree for seat reservations
-        self.available_seats = AvailableSeatsHeap()  # Min-heap for available seats
+        self.available_seats: list[int] = []  # Min-heap (heapq) for released seats
+        # Seats next_fresh_seat..total_seats have never been reserved
+        self.next_fresh_seat = 1
         self.waitlist = MinHeap()  # Min-heap for waitlist
         self.total_seats = 0
         self.timestamp_counter = 0
         self.output_file = output_file
+        self.verbose = verbose  # Echo every output line to stdout
+        self.binary_log = binary_log  # Write _RECORD structs instead of text
+        # Kept open for the whole run; output is collected in a buffer and
+        # written in large chunks by _flush()
+        self._out: IO[Any] = open(output_file, "wb" if binary_log else "w")
+        self._buf: list[str] = []
+        self._buf_size = 0
+        self._records = bytearray(_OUTPUT_FLUSH_SIZE if binary_log else 0)
+        self._records_size = 0
+
+    def __enter__(self) -> "SeatReservationSystem":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._flush()
+        self._out.close()
+
+    def _flush(self) -> None:
+        if self.binary_log:
+            self._out.write(memoryview(self._records)[: self._records_size])
+            self._records_size = 0
+        else:
+            self._out.write("".join(self._buf))
+            self._buf.clear()
+            self._buf_size = 0
 
-    def write_output(self, message):
-        with open(self.output_file, "a") as f:
-            f.write(message + "\n")
-
-    def initialize(self, seat_count):
+    def _write_text(self, message: str) -> None:
+        """Buffer one text output line; text mode only, called by emit"""
+        if self.verbose:
+            print(message)
+        self._buf.append(message)
+        self._buf.append("\n")
+        self._buf_size += len(message) + 1
+        if self._buf_size >= _OUTPUT_FLUSH_SIZE:
+            self._flush()
+
+    def _write_text_lines(self, messages: list[str]) -> None:
+        """Buffer a batch of text output lines as one chunk; text mode only"""
+        if not messages:
+            return
+        if self.verbose:
+            print(*messages, sep="\n")
+        text = "\n".join(messages) + "\n"
+        self._buf.append(text)
+        self._buf_size += len(text)
+        if self._buf_size >= _OUTPUT_FLUSH_SIZE:
+            self._flush()
+
+    def _write_record(self, event: int, arg1: int = 0, arg2: int = 0) -> None:
+        _RECORD.pack_into(self._records, self._records_size, event, arg1, arg2)
+        self._records_size += _RECORD.size
+        if self._records_size + _RECORD.size > len(self._records):
+            self._flush()
+
+    def emit(self, event: int, *args: int) -> None:
+        """Write one output event, formatted as text or as a binary record"""
+        if not self.binary_log:
+            self._write_text(EVENT_FORMATS[event] % args)
+            return
+        if self.verbose:
+            print(EVENT_FORMATS[event] % args)
+        self._write_record(event, *args)
+
+    def emit_rows(self, event: int, rows: list[tuple[int, int]]) -> None:
+        """Write one output event per tuple of arguments in rows"""
+        if not self.binary_log:
+            fmt = EVENT_FORMATS[event]
+            self._write_text_lines([fmt % row for row in rows])
+            return
+        if self.verbose:
+            for row in rows:
+                print(EVENT_FORMATS[event] % row)
+        # Pending records go first so the batch stays in event order
+        self._flush()
+        pack = _RECORD.pack
+        self._out.write(b"".join([pack(event, *row) for row in rows]))
+
+    def initialize(self, seat_count: int) -> None:
         self.total_seats = seat_count
         self.reserved_seats = RedBlackTree()
-        self.available_seats = AvailableSeatsHeap()
         self.waitlist = MinHeap()
 
-        # Initialize available seats
-        for seat_id in range(1, seat_count + 1):
-            self.available_seats.insert(seat_id)
-        self.write_output(f"{seat_count} Seats are made available for reservation")
+        self.available_seats = []
+        self.next_fresh_seat = 1
+        self.emit(Event.INITIALIZED, seat_count)
+
+    def _take_seat(self) -> Optional[int]:
+        """Remove and return the lowest numbered available seat, or None"""
+        # Released seats were handed out earlier, so they are all below
+        # the never-reserved range
+        if self.available_seats:
+            return heapq.heappop(self.available_seats)
+        if self.next_fresh_seat <= self.total_seats:
+            seat = self.next_fresh_seat
+            self.next_fresh_seat += 1
+            return seat
+        return None
+
+    def available_count(self) -> int:
+        # A non-positive Initialize or AddSeats count can leave total_seats
+        # below the fresh range, which then holds no seats
+        fresh = max(0, self.total_seats - self.next_fresh_seat + 1)
+        return len(self.available_seats) + fresh
 
-    def available(self):
-        message = f"Total Seats Available : {len(self.available_seats.heap)}, Waitlist : {len(self.waitlist.heap)}"
-        print(message)
-        self.write_output(message)
+    def available(self) -> None:
+        self.emit(Event.AVAILABLE, self.available_count(), len(self.waitlist))
 
-    def reserve(self, user_id, user_priority):
+    def reserve(self, user_id: int, user_priority: int) -> None:
         """
         Handles seat reservation requests.
 
@@ -524,115 +637,79 @@ class SeatReservationSystem:
 
         """
 
-        next_seat = self.available_seats.extract_min()
+        next_seat = self._take_seat()
 
         if next_seat is not None:
             self.reserved_seats.insert(user_id, next_seat)
-            message = f"User {user_id} reserved seat {next_seat}"
-            print(message)
-            self.write_output(message)
+            self.emit(Event.RESERVED, user_id, next_seat)
         else:
             # Add to waitlist - lower priority number means higher priority
             self.timestamp_counter += 1
             self.waitlist.insert(-user_priority, self.timestamp_counter, user_id)
-            message = f"User {user_id} is added to the waiting list"
-            print(message)
-            self.write_output(message)
+            self.emit(Event.WAITLISTED, user_id)
 
-    def cancel(self, seat_id, user_id):
+    def cancel(self, seat_id: int, user_id: int) -> None:
         node = self.reserved_seats.find_by_seat_id(seat_id)
 
         if node and node.user_id == user_id:
             self.reserved_seats.delete_node(node)
-            message = f"User {user_id} canceled their reservation"
-            print(message)
-            self.write_output(message)
+            self.emit(Event.CANCELED, user_id)
 
             next_user = self.waitlist.extract_min()
-            if next_user:
+            if next_user is not None:
                 # Assign to highest priority waiting user
-                self.reserved_seats.insert(next_user.user_id, seat_id)
-                message = f"User {next_user.user_id} reserved seat {seat_id}"
-                print(message)
-                self.write_output(message)
+                self.reserved_seats.insert(next_user, seat_id)
+                self.emit(Event.RESERVED, next_user, seat_id)
             else:
-                self.available_seats.insert(seat_id)
+                heapq.heappush(self.available_seats, seat_id)
         else:
-            message = f"User {user_id} has no reservation for seat {seat_id} to cancel"
-            print(message)
-            self.write_output(message)
+            self.emit(Event.NOT_CANCELED, user_id, seat_id)
 
-    def update_priority(self, user_id, new_priority):
+    def update_priority(self, user_id: int, new_priority: int) -> None:
         """
         Updates user's priority in waitlist.
 
         Flow:
         1. Find user in waitlist
-        2. Remove from current position
+        2. Invalidate their current heap entry
         3. Reinsert with new priority but same timestamp
-        4. Maintain heap properties
 
         """
 
-        if user_id in self.waitlist.position:
-            idx = self.waitlist.position[user_id]
-            original_timestamp = self.waitlist.heap[idx].timestamp
-
-            # Remove and reinsert with new priority
-            self.waitlist.remove_user(user_id)
-            self.waitlist.insert(-new_priority, original_timestamp, user_id)
-
-            message = f"User {user_id} priority has been updated to {new_priority}"
-            print(message)
-            self.write_output(message)
+        if self.waitlist.update_priority(user_id, -new_priority):
+            self.emit(Event.PRIORITY_UPDATED, user_id, new_priority)
         else:
-            message = f"User {user_id} priority is not updated"
-            print(message)
-            self.write_output(message)
+            self.emit(Event.PRIORITY_NOT_UPDATED, user_id)
 
-    def add_seats(self, count):
-        message = f"Additional {count} Seats are made available for reservation"
-        print(message)
-        self.write_output(message)
+    def add_seats(self, count: int) -> None:
+        self.emit(Event.SEATS_ADDED, count)
 
-        new_seat_start = self.total_seats + 1
+        # New seats extend the never-reserved range. Users only wait while
+        # no seat is available, so any waiting users get the new seats in order.
         self.total_seats += count
 
-        # Create list of new seats and sort them
-        new_seats = sorted(range(new_seat_start, new_seat_start + count))
-
         # Assign seats to waiting users in priority order
-        for seat in new_seats:
+        while self.waitlist:
+            seat = self._take_seat()
+            if seat is None:
+                break
             next_user = self.waitlist.extract_min()
-            if next_user:
-                self.reserved_seats.insert(next_user.user_id, seat)
-                message = f"User {next_user.user_id} reserved seat {seat}"
-                print(message)
-                self.write_output(message)
-            else:
-                self.available_seats.insert(seat)
+            assert next_user is not None  # the waitlist is not empty
+            self.reserved_seats.insert(next_user, seat)
+            self.emit(Event.RESERVED, next_user, seat)
 
-    def exit_waitlist(self, user_id):
+    def exit_waitlist(self, user_id: int) -> None:
         """Remove a user from the waitlist if they are present."""
         # Try to remove user from waitlist
         if self.waitlist.remove_user(user_id):
-            message = f"User {user_id} is removed from the waiting list"
-            print(message)
-            self.write_output(message)
+            self.emit(Event.LEFT_WAITLIST, user_id)
         else:
-            message = f"User {user_id} is not in waitlist"
-            print(message)
-            self.write_output(message)
+            self.emit(Event.NOT_IN_WAITLIST, user_id)
 
-    def print_reservations(self):
-        reservations = self.reserved_seats.get_sorted_reservations()
-        if reservations:
-            for seat_id, user_id in reservations:
-                message = f"Seat {seat_id}, User {user_id}"
-                print(message)
-                self.write_output(message)
+    def print_reservations(self) -> None:
+        self.emit_rows(Event.RESERVATION, self.reserved_seats.get_sorted_reservations())
 
-    def release_seats(self, user_id1, user_id2):
+    def release_seats(self, user_id1: int, user_id2: int) -> None:
         """
         Releases all seats for users in given ID range.
 
@@ -645,43 +722,36 @@ class SeatReservationSystem:
         """
 
         released_seats = []
-        # Get all reservations and sort by seat_id
-        reservations = self.reserved_seats.get_sorted_reservations()
-
-        # Collect seats to be released
-        for seat_id, user_id in reservations:
-            if user_id1 <= user_id <= user_id2:
-                node = self.reserved_seats.find_by_user_id(user_id)
-                if node:
-                    self.reserved_seats.delete_node(node)
-                    released_seats.append(seat_id)
+        # Collect and delete only the reservations in the user_id range
+        for node in self.reserved_seats.range_query(user_id1, user_id2):
+            self.reserved_seats.delete_node(node)
+            released_seats.append(node.seat_id)
 
         # Remove users from waitlist
-        users_to_remove = []
-        for node in self.waitlist.heap:
-            if user_id1 <= node.user_id <= user_id2:
-                users_to_remove.append(node.user_id)
-
-        for user_id in users_to_remove:
-            self.waitlist.remove_user(user_id)
+        self.waitlist.remove_range(user_id1, user_id2)
 
-        message = f"Reservations of the Users in the range [{user_id1}, {user_id2}] are released"
-        print(message)
-        self.write_output(message)
+        self.emit(Event.RELEASED, user_id1, user_id2)
 
         # Reassign released seats in order
         for seat_id in sorted(released_seats):
             next_user = self.waitlist.extract_min()
-            if next_user:
-                self.reserved_seats.insert(next_user.user_id, seat_id)
-                message = f"User {next_user.user_id} reserved seat {seat_id}"
-                print(message)
-                self.write_output(message)
+            if next_user is not None:
+                self.reserved_seats.insert(next_user, seat_id)
+                self.emit(Event.RESERVED, next_user, seat_id)
             else:
-                self.available_seats.insert(seat_id)
+                heapq.heappush(self.available_seats, seat_id)
 
 
-def main():
+def decode_binary_log(path: str) -> Iterator[str]:
+    """Yield the text output lines recorded in a binary log"""
+    with open(path, "rb") as f:
+        data = f.read()
+    for event, arg1, arg2 in _RECORD.iter_unpack(data):
+        fmt = EVENT_FORMATS[event]
+        yield fmt % (arg1, arg2)[: fmt.count("%d")]
+
+
+def main() -> None:
     """
     Main program entry point.
 
@@ -693,54 +763,78 @@ def main():
     5. Manages error conditions
 
     Input Format: command(arg1, arg2, ...)
-    Output: Written to inputfile_output_file.txt
+    Output: Written to inputfile_output_file.txt, or to
+    inputfile_output_file.bin with --binary-log
     """
 
-    if len(sys.argv) != 2:
-        print("Usage: python gator_ticket_master.py <input_file>")
-        return
-
-    input_file = sys.argv[1]
-    output_file_name = input_file.split(".")[0] + "_output_file.txt"
+    parser = argparse.ArgumentParser(description="GatorTicketMaster seat reservations")
+    parser.add_argument("input_file", help="file with one command per line")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="also print every output line to stdout",
+    )
+    parser.add_argument(
+        "--binary-log",
+        action="store_true",
+        help="write fixed-size binary event records instead of text",
+    )
+    parser.add_argument(
+        "--decode",
+        action="store_true",
+        help="print the binary log given as input_file as text and exit",
+    )
+    options = parser.parse_args()
+
+    input_file = options.input_file
+    extension = ".bin" if options.binary_log else ".txt"
+    output_file_name = input_file.split(".")[0] + "_output_file" + extension
 
     try:
-        with open(input_file, "r") as file:
-            system = SeatReservationSystem(output_file_name)
+        if options.decode:
+            for message in decode_binary_log(input_file):
+                print(message)
+            return
+
+        with open(input_file, "r") as file, SeatReservationSystem(
+            output_file_name, verbose=options.verbose, binary_log=options.binary_log
+        ) as system:
+            commands = {
+                "Initialize": lambda a: system.initialize(int(a[0])),
+                "Reserve": lambda a: system.reserve(int(a[0]), int(a[1])),
+                "Cancel": lambda a: system.cancel(int(a[0]), int(a[1])),
+                "ExitWaitlist": lambda a: system.exit_waitlist(int(a[0])),
+                "UpdatePriority": lambda a: system.update_priority(
+                    int(a[0]), int(a[1])
+                ),
+                "AddSeats": lambda a: system.add_seats(int(a[0])),
+                "Available": lambda a: system.available(),
+                "PrintReservations": lambda a: system.print_reservations(),
+                "ReleaseSeats": lambda a: system.release_seats(int(a[0]), int(a[1])),
+            }
 
             for line in file:
                 line = line.strip()
                 if not line:
                     continue
 
-                match = re.match(r"(\w+)\((.*)\)", line)
-                if match:
-                    command = match.group(1)
-                    args = [
-                        arg.strip() for arg in match.group(2).split(",") if arg.strip()
-                    ]
-
-                    if command == "Initialize":
-                        system.initialize(int(args[0]))
-                    elif command == "Reserve":
-                        system.reserve(int(args[0]), int(args[1]))
-                    elif command == "Cancel":
-                        system.cancel(int(args[0]), int(args[1]))
-                    elif command == "ExitWaitlist":
-                        system.exit_waitlist(int(args[0]))
-                    elif command == "UpdatePriority":
-                        system.update_priority(int(args[0]), int(args[1]))
-                    elif command == "AddSeats":
-                        system.add_seats(int(args[0]))
-                    elif command == "Available":
-                        system.available()
-                    elif command == "PrintReservations":
-                        system.print_reservations()
-                    elif command == "ReleaseSeats":
-                        system.release_seats(int(args[0]), int(args[1]))
-                    elif command == "Quit":
-                        print("Program Terminated!!")
-                        system.write_output("Program Terminated!!")
-                        break
+                # Command(arg1, arg2, ...) is simple enough to split by hand
+                open_paren = line.find("(")
+                close_paren = line.rfind(")")
+                if open_paren <= 0 or close_paren < open_paren:
+                    continue
+
+                command = line[:open_paren]
+                if command == "Quit":
+                    system.emit(Event.TERMINATED)
+                    break
+
+                handler = commands.get(command)
+                if handler:
+                    # Blank slots such as "Reserve(1,,2)" are skipped; int()
+                    # ignores surrounding whitespace, so args are not stripped
+                    body = line[open_paren + 1 : close_paren]
+                    handler([arg for arg in body.split(",") if arg.strip()])
 
     except FileNotFoundError:
         print(f"Error: File '{input_file}' not found.")